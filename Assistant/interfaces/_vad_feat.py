@@ -0,0 +1,119 @@
+"""
+Acoustic feature helpers for the batch-decode result cache.
+
+Computes a compact MFCC summary of one utterance (mean-pooled over time)
+that vad_voice's offline recognize_batch path uses as a cache
+fingerprint; live streaming recognition decodes incrementally and does
+not use it. The FFT runs through NumPy
+(numba has no rfft support); the mel filterbank accumulation, log and
+DCT - the actual hot loops - are JIT-compiled when numba is installed
+and fall back to plain NumPy matrix products otherwise.
+"""
+import numpy as np
+
+# Optional: numba JIT for the mel/DCT accumulation loops
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+N_MELS = 40
+N_MFCC = 13
+
+# Per (sample_rate, n_fft_bins) precomputed matrices - built once, reused
+# for every fingerprint
+_fb_cache = {}
+
+
+def _hz_to_mel(hz):
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+
+def _mel_to_hz(mel):
+    return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+
+def _mel_filterbank(sample_rate: int, n_bins: int) -> np.ndarray:
+    """Triangular mel filterbank, shape (N_MELS, n_bins), float32."""
+    n_fft = (n_bins - 1) * 2
+    mel_points = np.linspace(
+        _hz_to_mel(0.0), _hz_to_mel(sample_rate / 2.0), N_MELS + 2
+    )
+    bin_points = np.floor(
+        (n_fft + 1) * _mel_to_hz(mel_points) / sample_rate
+    ).astype(np.int64)
+
+    fb = np.zeros((N_MELS, n_bins), dtype=np.float32)
+    for m in range(1, N_MELS + 1):
+        left, center, right = bin_points[m - 1], bin_points[m], bin_points[m + 1]
+        for k in range(left, center):
+            if center > left:
+                fb[m - 1, k] = (k - left) / (center - left)
+        for k in range(center, right):
+            if right > center:
+                fb[m - 1, k] = (right - k) / (right - center)
+    return fb
+
+
+def _dct_matrix() -> np.ndarray:
+    """Orthonormal DCT-II matrix, shape (N_MFCC, N_MELS), float32."""
+    n = np.arange(N_MELS)
+    k = np.arange(N_MFCC)[:, None]
+    dct = np.cos(np.pi * k * (2 * n + 1) / (2.0 * N_MELS))
+    dct[0] *= 1.0 / np.sqrt(2.0)
+    return (dct * np.sqrt(2.0 / N_MELS)).astype(np.float32)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _mel_log_dct(power, mel_fb, dct_m, out):
+        """Fused mel accumulation + log + DCT, mean-pooled over frames."""
+        n_frames = power.shape[0]
+        n_mels = mel_fb.shape[0]
+        n_mfcc = dct_m.shape[0]
+        mel = np.empty(n_mels, dtype=np.float32)
+        out[:] = 0.0
+        for t in range(n_frames):
+            for m in range(n_mels):
+                acc = 0.0
+                for k in range(mel_fb.shape[1]):
+                    acc += mel_fb[m, k] * power[t, k]
+                mel[m] = np.log(acc + 1e-10)
+            for c in range(n_mfcc):
+                acc = 0.0
+                for m in range(n_mels):
+                    acc += dct_m[c, m] * mel[m]
+                out[c] += acc
+        for c in range(n_mfcc):
+            out[c] /= n_frames
+else:
+    def _mel_log_dct(power, mel_fb, dct_m, out):
+        mel = np.log(power @ mel_fb.T + 1e-10)
+        out[:] = (mel @ dct_m.T).mean(axis=0)
+
+
+def mfcc_fingerprint(samples: np.ndarray, sample_rate: int, frame_size: int) -> np.ndarray:
+    """Mean-pooled MFCC vector (N_MFCC,) for one int16 utterance.
+
+    Sub-millisecond on a typical 2s command; returns float32. The caller
+    quantizes and hashes it for cache lookup.
+    """
+    usable = samples.size - samples.size % frame_size
+    frames = samples[:usable].reshape(-1, frame_size).astype(np.float32)
+
+    key = (sample_rate, frame_size)
+    cached = _fb_cache.get(key)
+    if cached is None:
+        window = np.hanning(frame_size).astype(np.float32)
+        n_bins = frame_size // 2 + 1
+        cached = (window, _mel_filterbank(sample_rate, n_bins), _dct_matrix())
+        _fb_cache[key] = cached
+    window, mel_fb, dct_m = cached
+
+    spectrum = np.fft.rfft(frames * window, axis=1)
+    power = (spectrum.real ** 2 + spectrum.imag ** 2).astype(np.float32)
+
+    out = np.empty(N_MFCC, dtype=np.float32)
+    _mel_log_dct(power, mel_fb, dct_m, out)
+    return out
@@ -2,9 +2,12 @@
 Voice Interface - FIXED VERSION
 Fixes TTS threading issues and adds better audio handling.
 """
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import queue
 import threading
 
 _current_dir = Path(__file__).parent.parent
@@ -31,6 +34,59 @@ except ImportError:
     logger.warning("pyttsx3 not available")
 
 
+@lru_cache(maxsize=1)
+def _enumerate_devices():
+    """PortAudio device enumeration, cached process-wide.
+
+    sd.query_devices walks the ALSA/PortAudio device list every call
+    (tens of ms); the list doesn't change at runtime, so pay it once.
+    """
+    import sounddevice as sd
+    return sd.query_devices(), sd.query_devices(kind='input')
+
+
+def invalidate_audio_devices():
+    """Drop the cached device list (e.g. after an audio device hot-plug)."""
+    _enumerate_devices.cache_clear()
+
+
+# Sentence boundaries for incremental TTS delivery - compiled once
+_SENTENCE_SPLIT = re.compile(r'(?<=[.?!])\s+|\n\n+')
+
+
+def _split_sentences(text: str) -> list:
+    """Split text into sentences so TTS can start on the first one early."""
+    return [s for s in _SENTENCE_SPLIT.split(text) if s and s.strip()]
+
+
+# Process-wide pyttsx3 engine. Driver init (SAPI5/espeak COM/shared-lib
+# load) costs 200-500ms, so it's paid once per process; each
+# VoiceInterface just reapplies its own rate/volume/voice properties.
+_TTS_ENGINE = None
+_TTS_VOICES = None
+_TTS_LOCK = threading.Lock()
+
+
+def _get_tts_engine(rate: int, volume: float, voice_id: Optional[int] = None):
+    """Return the shared pyttsx3 engine configured with the given properties."""
+    global _TTS_ENGINE, _TTS_VOICES
+    with _TTS_LOCK:
+        if _TTS_ENGINE is None:
+            _TTS_ENGINE = pyttsx3.init()
+            # Voice enumeration re-queries the driver (COM on SAPI5)
+            # each call - the installed set doesn't change at runtime,
+            # so snapshot it alongside the engine
+            _TTS_VOICES = _TTS_ENGINE.getProperty('voices')
+        engine = _TTS_ENGINE
+        engine.setProperty('rate', rate)
+        engine.setProperty('volume', volume)
+
+        if voice_id is not None and voice_id < len(_TTS_VOICES):
+            engine.setProperty('voice', _TTS_VOICES[voice_id].id)
+            logger.info(f"Using voice: {_TTS_VOICES[voice_id].name}")
+        return engine
+
+
 class VoiceInterface:
     """Voice interface for speech recognition and TTS."""
     
@@ -41,7 +97,7 @@ class VoiceInterface:
         self.microphone = None
         self.tts_engine = None
         self.audio_available = False
-        self._tts_lock = threading.Lock()  # Thread safety for TTS
+        self._ambient_event = threading.Event()  # Set once calibration is done
         
         # Initialize speech recognition
         if SPEECH_RECOGNITION_AVAILABLE:
@@ -57,15 +113,17 @@ class VoiceInterface:
                 # Test microphone
                 self.microphone = sr.Microphone()
                 
-                # Get default input device info
-                import sounddevice as sd
-                devices = sd.query_devices()
-                default_input = sd.query_devices(kind='input')
+                # Get default input device info (cached enumeration)
+                devices, default_input = _enumerate_devices()
                 logger.info(f"Found {len(devices)} audio devices")
                 logger.info(f"Default input device: {default_input['name']}")
                 
                 self.audio_available = True
                 logger.info("Voice recognition initialized")
+
+                # Calibrate ambient noise in the background so the first
+                # listen() doesn't spend a full second on it
+                threading.Thread(target=self._adjust_ambient, daemon=True).start()
                 
             except Exception as e:
                 logger.error(f"Failed to initialize speech recognition: {e}")
@@ -74,31 +132,39 @@ class VoiceInterface:
         # Initialize TTS
         if PYTTSX3_AVAILABLE:
             try:
-                # Create TTS engine in main thread
-                self.tts_engine = pyttsx3.init()
-                
-                # Configure TTS
+                # Reuse the process-wide engine - only the first
+                # VoiceInterface in the process pays driver init
                 tts_config = config.get('interfaces', {}).get('tts', {})
-                rate = tts_config.get('rate', 150)
-                volume = tts_config.get('volume', 0.9)
-                
-                self.tts_engine.setProperty('rate', rate)
-                self.tts_engine.setProperty('volume', volume)
-                
-                # Get voices
-                voices = self.tts_engine.getProperty('voices')
-                voice_id = tts_config.get('voice_id')
-                
-                if voice_id and voice_id < len(voices):
-                    self.tts_engine.setProperty('voice', voices[voice_id].id)
-                    logger.info(f"Using voice: {voices[voice_id].name}")
-                
+                self.tts_engine = _get_tts_engine(
+                    tts_config.get('rate', 150),
+                    tts_config.get('volume', 0.9),
+                    tts_config.get('voice_id'),
+                )
+
+                # Single long-lived worker consumes the queue so speak()
+                # never blocks on playback
+                self._tts_queue = queue.Queue()
+                self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
+                self._tts_thread.start()
+
                 logger.info("TTS engine initialized")
-                
+
             except Exception as e:
                 logger.error(f"Failed to initialize TTS: {e}")
                 self.tts_engine = None
     
+    def _adjust_ambient(self):
+        """Ambient-noise calibration, off the first-listen critical path."""
+        try:
+            logger.debug("Adjusting for ambient noise...")
+            with self.microphone as source:
+                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            logger.debug("Ambient noise calibration complete")
+        except Exception as e:
+            logger.debug(f"Ambient calibration failed (using defaults): {e}")
+        finally:
+            self._ambient_event.set()
+
     def listen(
         self,
         timeout: Optional[float] = None,
@@ -118,14 +184,12 @@ class VoiceInterface:
             logger.warning("Audio not available for listening")
             return None
         
+        # Wait briefly for the background ambient calibration; if it
+        # hasn't finished, proceed with the configured energy threshold
+        self._ambient_event.wait(timeout=2.0)
+
         try:
             with self.microphone as source:
-                # Adjust for ambient noise if first time
-                if not hasattr(self, '_ambient_adjusted'):
-                    logger.debug("Adjusting for ambient noise...")
-                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
-                    self._ambient_adjusted = True
-                
                 # Listen for audio
                 logger.debug(f"Recording audio for {phrase_time_limit}s...")
                 audio = self.recognizer.listen(
@@ -153,42 +217,53 @@ class VoiceInterface:
             logger.error(f"Error during listening: {e}")
             return None
     
+    def _tts_worker(self):
+        """Long-lived TTS consumer - speak() only enqueues."""
+        while True:
+            text = self._tts_queue.get()
+            try:
+                # The engine is process-wide, so serialization has to be
+                # too - each instance has its own worker thread, and
+                # concurrent runAndWait on one pyttsx3 engine is not safe
+                with _TTS_LOCK:
+                    # Sentence-by-sentence so audio for the first
+                    # sentence starts while the rest of a long reply
+                    # is still queued
+                    for sentence in _split_sentences(text):
+                        self.tts_engine.say(sentence)
+                        self.tts_engine.runAndWait()
+            except Exception as e:
+                logger.error(f"TTS error in worker: {e}")
+            finally:
+                self._tts_queue.task_done()
+
     def speak(self, text: str):
         """
-        Speak text using TTS.
-        
+        Queue text for speech; returns immediately.
+
         Args:
             text: Text to speak.
         """
         if not self.tts_engine:
             logger.warning("TTS engine not available")
             return
-        
-        try:
-            with self._tts_lock:  # Thread-safe TTS
-                # Stop any ongoing speech
-                self.tts_engine.stop()
-                
-                # Speak in a separate thread to avoid blocking
-                def _speak_thread():
-                    try:
-                        self.tts_engine.say(text)
-                        self.tts_engine.runAndWait()
-                    except Exception as e:
-                        logger.error(f"TTS error in thread: {e}")
-                
-                # Create and start thread
-                thread = threading.Thread(target=_speak_thread, daemon=True)
-                thread.start()
-                thread.join(timeout=30)  # Max 30 seconds for speech
-                
-        except Exception as e:
-            logger.error(f"Failed to speak: {e}")
+
+        self._tts_queue.put(text)
+
+    def wait_until_done(self):
+        """Block until all queued speech has finished playing."""
+        if self.tts_engine:
+            self._tts_queue.join()
     
     def cleanup(self):
-        """Clean up resources."""
+        """Clean up resources.
+
+        The engine is shared process-wide, so don't stop() it here -
+        that would cut off another instance's in-flight speech. Just
+        let our own queued text finish.
+        """
         if self.tts_engine:
             try:
-                self.tts_engine.stop()
+                self._tts_queue.join()
             except Exception:
                 pass
\ No newline at end of file
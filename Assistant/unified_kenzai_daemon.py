@@ -4,6 +4,7 @@ Fixes VAD continuous listening startup and adds better error handling.
 Single file for all daemon functionality with proper wake/sleep modes.
 Supports both Porcupine wake word and VAD continuous listening.
 """
+import re
 import sys
 import time
 import signal
@@ -53,6 +54,20 @@ class DaemonMode(Enum):
     AWAKE = "awake"      # Fully active, processing commands
 
 
+# Sleep commands, compiled once to a case-insensitive word-boundary
+# alternation - one regex pass per command instead of lowercasing the
+# text and scanning it per phrase, and 'rest' no longer matches inside
+# words like 'restart'
+_SLEEP_PHRASES = (
+    'go to sleep', 'goodbye', 'rest', 'dismiss',
+    'that is all', 'you may leave', 'sleep now',
+    'go back to sleep', 'return to sleep',
+)
+_SLEEP_RE = re.compile(
+    r'(?i)\b(?:' + '|'.join(re.escape(p) for p in _SLEEP_PHRASES) + r')\b'
+)
+
+
 class SystemTrayIcon:
     """System tray icon with context menu."""
     
@@ -380,8 +395,18 @@ class KenzAIUnifiedDaemon:
         voice = self.vad_interface or self.voice_interface
         if voice and hasattr(voice, 'tts_engine') and voice.tts_engine:
             try:
+                def _speak_greeting():
+                    voice.speak(greeting)
+                    # speak() only enqueues; for the plain VoiceInterface
+                    # the fallback command loop has no TTS-gated capture,
+                    # so block here until playback finishes - otherwise
+                    # its first listen() transcribes the greeting itself.
+                    # VADVoiceInterface suppresses its own mic during TTS.
+                    if voice is self.voice_interface and hasattr(voice, 'wait_until_done'):
+                        voice.wait_until_done()
+
                 # Speak in a thread with timeout to prevent blocking
-                speak_thread = threading.Thread(target=voice.speak, args=(greeting,), daemon=True)
+                speak_thread = threading.Thread(target=_speak_greeting, daemon=True)
                 speak_thread.start()
                 speak_thread.join(timeout=5.0)  # Max 5 seconds for greeting
                 
@@ -442,25 +467,33 @@ class KenzAIUnifiedDaemon:
         if not self._command_lock.acquire(blocking=False):
             self.logger.debug("Command already being processed, skipping...")
             return
+
+        def respond(message):
+            """Speak through the active voice interface.
+
+            The plain VoiceInterface has no mic suppression during
+            playback, so wait for its queued speech to finish before the
+            fallback command loop listens again - otherwise the next
+            listen() transcribes our own reply. VADVoiceInterface gates
+            its own capture on TTS (_tts_active), so it stays async.
+            """
+            voice = self.vad_interface or self.voice_interface
+            if not voice:
+                return
+            voice.speak(message)
+            if voice is self.voice_interface and hasattr(voice, 'wait_until_done'):
+                voice.wait_until_done()
         
         try:
             self.logger.info(f"\n💬 You: {text}")
             
-            # Check for sleep commands
-            sleep_phrases = [
-                'go to sleep', 'goodbye', 'rest', 'dismiss',
-                'that is all', 'you may leave', 'sleep now',
-                'go back to sleep', 'return to sleep'
-            ]
-            
-            if any(phrase in text.lower() for phrase in sleep_phrases):
+            # Check for sleep commands (precompiled word-boundary regex)
+            if _SLEEP_RE.search(text):
                 response = "Rest well, your Highness. I shall await your call."
                 self.logger.info(f"🎙️ KenzAI: {response}\n")
                 
-                voice = self.vad_interface or self.voice_interface
-                if voice:
-                    voice.speak(response)
-                
+                respond(response)
+
                 time.sleep(2)
                 self.go_to_sleep()
                 return
@@ -472,17 +505,11 @@ class KenzAIUnifiedDaemon:
                 self.logger.info(f"🎙️ KenzAI: {response}\n")
                 
                 # Speak response
-                voice = self.vad_interface or self.voice_interface
-                if voice:
-                    voice.speak(response)
-            
+                respond(response)
+
             except Exception as e:
                 self.logger.error(f"Error processing command: {e}", exc_info=True)
-                error_msg = "I apologize, but I encountered an error."
-                
-                voice = self.vad_interface or self.voice_interface
-                if voice:
-                    voice.speak(error_msg)
+                respond("I apologize, but I encountered an error.")
         
         finally:
             self._command_lock.release()